@@ -1,13 +1,47 @@
-import os, json, csv, datetime, random, math
-import pandas as pd
+import os, io, sys, json, csv, datetime, random, math, time, operator, itertools, functools
+import numpy as np
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Tuple, Union
 from collections import *
 
+try:
+    import networkx as nx # optional: enables polynomial-time blossom matching in PairingEngine
+except ImportError:
+    nx = None
+
+# C-level sort key for the common "by points, then ELO" ordering
+_POINTS_ELO = operator.attrgetter("points", "elo")
+_ELO = operator.attrgetter("elo")
+
+# Longest player name kept as is; longer names are shortened to initials (see Player._name_surname_encoder)
+NAME_LENGTH_LIMIT: int = 20
+
+# Rank, name, ELO, points, bye, present, color balance: one row of the standings TXT export
+_STANDINGS_ROW_FMT = "{:<5} {:<25} {:<6} {:<7.1f} {:<5} {:<8} {:<10}\n"
+
+# Standings labels: bye column keyed on (had_regular_bye, has_bye_this_round), yes/no keyed on a flag
+_BYE_LABEL = {(True, True): "Reg", (True, False): "Reg", (False, True): "Half", (False, False): "No"}
+_YES_NO = {True: "Yes", False: "No"}
+
+# Buffer size for CSV/TXT files: a whole save or load normally takes a single write or read call
+_IO_BUFFER_SIZE = 1 << 20
+
 
 # --- Player Class ---
 class Player:
     """Represents a chess player in the tournament."""
+
+    __slots__ = ("id", "name_surname", "elo", "points", "bonus_points", "past_colors", "past_matches", "past_opponents",
+                 "past_opponents_set", "had_regular_bye", "has_bye_this_round", "is_present", "color_balance_counter",
+                 "past_results", "_str_cache", "_str_dirty")
+
+    # Column order of the players CSV (see `to_row`)
+    CSV_FIELDS: Tuple[str, ...] = ("id", "name_surname", "elo", "points", "past_colors", "past_matches", "past_opponents",
+                                   "had_regular_bye", "has_bye_this_round", "is_present", "color_balance_counter", "past_results")
+
+    # Bumped by every add_points(), so cached standings can tell that some score changed
+    _points_generation: int = 0
+
     def __init__(self, id: int, name_surname: str, elo: int):
         if not isinstance(id, int) or id < 0:
             raise ValueError("Player ID must be a non-negative integer.")
@@ -25,35 +59,39 @@ class Player:
         self.past_colors: list[str] = []
         self.past_matches: list[int] = []
         self.past_opponents: list[int] = []
+        # Same IDs as past_opponents for O(1) rematch checks; the list keeps the round order
+        self.past_opponents_set: set[int] = set()
         self.had_regular_bye = False
         self.has_bye_this_round = False
         self.is_present = True
         self.color_balance_counter = 0
         self.past_results: list[str] = []
+        # __str__ is rebuilt only after the points change
+        self._str_cache: str = ""
+        self._str_dirty: bool = True
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096) # names are looked up repeatedly (get_player_by_name, loads)
     def _name_surname_encoder(name_surname: str) -> str:
-        """Encode name to fit within length limits (20 characters).
+        """Encode name to fit within length limits (NAME_LENGTH_LIMIT characters).
         Args:
             name_surname (str): Player name.
         Returns:
             str: Encoded name.
         """
-        length_limit: int = 20
         if name_surname is None or name_surname.strip() == "":
             return "BYE_OPPONENT"
-        if len(name_surname) < length_limit:
+        if len(name_surname) < NAME_LENGTH_LIMIT:
             return name_surname
         
-        name_surname_list = name_surname.split()
-        for i in range(len(name_surname_list) - 1):
-            name_surname_list[i] = name_surname_list[i][0] + ". "
-        name_surname = "".join(name_surname_list)
+        # "Anna Maria Rossi" -> "A. M. Rossi"
+        *given_names, surname = name_surname.split()
+        name_surname = "".join([name[0] + ". " for name in given_names]) + surname
         
-        if len(name_surname) < length_limit:
+        if len(name_surname) < NAME_LENGTH_LIMIT:
             return name_surname
         
-        return (name_surname[:length_limit - 3] + "...")
+        return (name_surname[:NAME_LENGTH_LIMIT - 3] + "...")
 
     @staticmethod
     def _elo_encoder(elo_input: int | float | None | str) -> int:
@@ -73,70 +111,152 @@ class Player:
             print(f"{TournamentUtils.now()} | Warning: Invalid ELO format '{elo_input}'. Defaulting to 100.")
             return 100
 
+    @staticmethod
+    def _int_list_encoder(values: List[int]) -> str:
+        """Encode a list of IDs for CSV as "1;5;12"."""
+        return ";".join(map(str, values))
+
+    @staticmethod
+    def _int_list_decoder(text: str | list | None) -> List[int]:
+        """Decode an ID list written by `_int_list_encoder`; JSON lists ("[1, 5]") from older saves and plain lists (`to_dict`) are accepted too."""
+        if not text:
+            return []
+        if isinstance(text, list):
+            return [int(x) for x in text]
+        if text.lstrip().startswith("["):
+            return [int(x) for x in json.loads(text)]
+        return [int(x) for x in text.split(";") if x]
+
+    @staticmethod
+    def _json_list_decoder(value: str | list) -> list:
+        """Decode a JSON list column; lists (as returned by `to_dict`) are copied as they are."""
+        if isinstance(value, list):
+            return list(value)
+        return json.loads(value)
+
+    @staticmethod
+    def _bool_decoder(value: str | bool) -> bool:
+        """Decode a "True"/"False" column (any case); bools are returned as they are."""
+        if isinstance(value, bool):
+            return value
+        return value.lower() == "true"
+
     def add_points(self, n: float) -> None:
         if not isinstance(n, (int, float)):
             raise TypeError("Points to add must be a number.")
-        self.points = math.fsum([self.points, n])
+        # Scores are multiples of 0.5, which float addition represents exactly
+        self.points += n
+        self._str_dirty = True
+        Player._points_generation += 1
 
     def add_bonus_points(self, n: float) -> None:   
         if not isinstance(n, (int, float)):
             raise TypeError("Points to add must be a number.")
-        self.bonus_points = math.fsum([self.points, n])
+        self.bonus_points += n
 
     def player_and_elo(self) -> str:
         return f"ID: {self.id :<3} | {self.name_surname :<20} ({self.elo :<4} elo)"
 
     def __str__(self) -> str:
-        return f"{self.name_surname} ({self.points:.1f} points)"
+        if self._str_dirty:
+            self._str_cache = f"{self.name_surname} ({self.points:.1f} points)"
+            self._str_dirty = False
+        return self._str_cache
 
     def __repr__(self) -> str:
         return f"<{self.name_surname} - {self.points} pts>"
     
+    def to_row(self) -> tuple:
+        """Returns the serialized Player values in `CSV_FIELDS` order."""
+        return (
+            self.id,
+            self.name_surname,
+            self.elo,
+            self.points,
+            json.dumps(self.past_colors),
+            self._int_list_encoder(self.past_matches),
+            self._int_list_encoder(self.past_opponents),
+            str(self.had_regular_bye),
+            str(self.has_bye_this_round),
+            str(self.is_present),
+            self.color_balance_counter,
+            json.dumps(self.past_results)
+        )
+
     def to_dict(self) -> dict:
-        """Returns a dictionary representation of the current Player object."""
+        """Returns a dictionary representation of the current Player object.
+        Lists and flags are kept as Python values (ready for `json.dump`); only `to_row` stringifies them for CSV.
+        """
         return {
             "id": self.id,
             "name_surname": self.name_surname,
             "elo": self.elo,
             "points": self.points,
-            "past_colors": json.dumps(self.past_colors),
-            "past_matches": json.dumps(self.past_matches),
-            "past_opponents": json.dumps(self.past_opponents),
-            "had_regular_bye": str(self.had_regular_bye),
-            "has_bye_this_round": str(self.has_bye_this_round),
-            "is_present": str(self.is_present),
+            "past_colors": self.past_colors.copy(),
+            "past_matches": self.past_matches.copy(),
+            "past_opponents": self.past_opponents.copy(),
+            "had_regular_bye": self.had_regular_bye,
+            "has_bye_this_round": self.has_bye_this_round,
+            "is_present": self.is_present,
             "color_balance_counter": self.color_balance_counter,
-            "past_results": json.dumps(self.past_results)
+            "past_results": self.past_results.copy()
         }
 
     @classmethod
     def from_dict(cls, data: dict) -> "Player":
         """ Create a Player object from a dictionary representation. (Usually used for loading from a JSON file)
         Args:
-            data (dict): Dictionary representation of the Player object.
+            data (dict): Dictionary representation of the Player object. Values may be Python lists/bools
+                (`to_dict`) or their CSV strings (older saves).
         Returns:
             Player: Player object created from the dictionary representation.
         """
+        return cls.from_row(list(data.values()), {key: i for i, key in enumerate(data)})
+
+    @classmethod
+    def from_row(cls, row: List[str], columns: Dict[str, int]) -> "Player":
+        """ Create a Player object from a positional CSV row (as yielded by `csv.reader`).
+        Args:
+            row (List[str]): Field values of one players CSV row.
+            columns (Dict[str, int]): Column name -> position in `row`, built once from the header.
+        Returns:
+            Player: Player object created from the row.
+        """
+        def field(name: str, default: str) -> str:
+            i = columns.get(name)
+            return row[i] if i is not None and i < len(row) else default
+
         player = cls(
-            id=int(data["id"]),
-            name_surname=Player._name_surname_encoder(data["name_surname"]),
-            elo=Player._elo_encoder(data["elo"])
+            id=int(row[columns["id"]]),
+            name_surname=Player._name_surname_encoder(row[columns["name_surname"]]),
+            elo=Player._elo_encoder(row[columns["elo"]])
         )
-        player.points = float(data["points"])
-        player.past_colors = json.loads(data.get("past_colors", "[]"))
-        player.past_matches = json.loads(data.get("past_matches", "[]"))
-        player.past_opponents = json.loads(data.get("past_opponents", "[]"))
-        player.had_regular_bye = data.get("had_regular_bye", "false").lower() == "true" 
-        player.has_bye_this_round = data.get("has_bye_this_round", "false").lower() == 'true'
-        player.is_present = data.get("is_present", "true").lower() == 'true'
-        player.color_balance_counter = int(data.get("color_balance_counter", 0))
-        player.past_results = json.loads(data.get("past_results", "[]"))
+        player.points = float(row[columns["points"]])
+        player.past_colors = Player._json_list_decoder(field("past_colors", "[]"))
+        player.past_matches = Player._int_list_decoder(field("past_matches", ""))
+        player.past_opponents = Player._int_list_decoder(field("past_opponents", ""))
+        player.past_opponents_set = set(player.past_opponents)
+        player.had_regular_bye = Player._bool_decoder(field("had_regular_bye", "false"))
+        player.has_bye_this_round = Player._bool_decoder(field("has_bye_this_round", "false"))
+        player.is_present = Player._bool_decoder(field("is_present", "true"))
+        player.color_balance_counter = int(field("color_balance_counter", "0"))
+        player.past_results = Player._json_list_decoder(field("past_results", "[]"))
         return player
 
 
 # --- Match Class ---
 class Match:
     """Represents a single chess match between two players."""
+
+    __slots__ = ("match_id", "player_white", "player_black", "round_number", "result", "is_bye_match", "is_half_bye_match",
+                 "_str_cache", "_str_result")
+
+    # Column order of the matches CSV (see `to_row`)
+    CSV_FIELDS: Tuple[str, ...] = ("match_id", "round_number", "player_white_id", "player_black_id", "result", "is_bye_match", "is_half_bye_match")
+
+    VALID_RESULTS: Tuple[str, ...] = ("1-0", "0-1", "0.5-0.5", "bye", "half bye")
+    _VALID_RESULTS_SET = frozenset(VALID_RESULTS)
+
     def __init__(self, match_id: int, player_white: Player, player_black: Optional[Player], round_number: int):
         if not isinstance(player_white, Player):
             raise TypeError("Player white must be a Player object.")
@@ -154,6 +274,8 @@ class Match:
         self.result = " - "
         self.is_bye_match = False
         self.is_half_bye_match = False
+        self._str_cache: str = ""
+        self._str_result: Optional[str] = None # result `_str_cache` was rendered for
 
         if player_black is None:
             self.is_bye_match = True
@@ -166,11 +288,10 @@ class Match:
         Raises:
             ValueError: If the result is not valid.
         """
-        valid_results = {"1-0", "0-1", "0.5-0.5", "bye", "half bye"}
-        if result not in valid_results:
-            raise ValueError(f"Invalid result format. Must be one of: {', '.join(valid_results)}")
+        if result not in self._VALID_RESULTS_SET:
+            raise ValueError(f"Invalid result format. Must be one of: {', '.join(self.VALID_RESULTS)}")
         
-        if self.is_bye_match and result not in ["bye", "half bye"]:
+        if self.is_bye_match and result not in ("bye", "half bye"):
             print(f"Warning: Match ID {self.match_id} (R{self.round_number}) is a bye match. Result cannot be changed to '{result}'.")
             return
 
@@ -179,27 +300,38 @@ class Match:
         self.result = result
 
     def __str__(self) -> str:
+        # Finished matches are rendered once; pending ones (" - ") are rebuilt on every call
+        if self._str_result == self.result:
+            return self._str_cache
         if self.is_bye_match:
             bye_type = "BYE" if self.result == "bye" else "HALF BYE"
-            return f"Match ID {self.match_id :<2} (R{self.round_number :<2}): {self.player_white.name_surname} ({bye_type}) - Result: {self.result}"
+            text = f"Match ID {self.match_id :<2} (R{self.round_number :<2}): {self.player_white.name_surname} ({bye_type}) - Result: {self.result}"
         else:
-            return (f"Match ID {self.match_id :<2} (R{self.round_number :<2}): {self.player_white.name_surname} (W) vs "
+            text = (f"Match ID {self.match_id :<2} (R{self.round_number :<2}): {self.player_white.name_surname} (W) vs "
                     f"{self.player_black.name_surname} (B) - Result: {self.result}")
+        if self.result != " - ":
+            self._str_cache = text
+            self._str_result = self.result
+        return text
 
     def __repr__(self):
         return f"<R{self.round_number} ID{self.match_id} | {self.player_white.name_surname} {self.result} {self.player_black.name_surname}>"
         
+    def to_row(self) -> tuple:
+        """Return the serialized Match values in `CSV_FIELDS` order."""
+        return (
+            self.match_id,
+            self.round_number,
+            self.player_white.id,
+            self.player_black.id,
+            self.result,
+            str(self.is_bye_match),
+            str(self.is_half_bye_match)
+        )
+
     def to_dict(self) -> dict:
         """Return dictionary rappresentation of the current match."""
-        return {
-            "match_id": self.match_id,
-            "round_number": self.round_number,
-            "player_white_id": self.player_white.id,
-            "player_black_id": self.player_black.id,
-            "result": self.result,
-            "is_bye_match": str(self.is_bye_match),
-            "is_half_bye_match": str(self.is_half_bye_match)
-        }
+        return dict(zip(self.CSV_FIELDS, self.to_row()))
 
     @classmethod
     def from_dict(cls, data: dict, players_by_id: dict) -> 'Match':
@@ -212,25 +344,44 @@ class Match:
         Raises:
             ValueError: If the player IDs in the data are not found in the players_by_id dictionary.
         """
-        white_id = int(data["player_white_id"])
-        black_id = int(data["player_black_id"])
+        return cls.from_row(list(data.values()), {key: i for i, key in enumerate(data)}, players_by_id)
+
+    @classmethod
+    def from_row(cls, row: List[str], columns: Dict[str, int], players_by_id: dict) -> 'Match':
+        """Create a Match object from a positional CSV row (as yielded by `csv.reader`).
+        Args:
+            row (List[str]): Field values of one matches CSV row.
+            columns (Dict[str, int]): Column name -> position in `row`, built once from the header.
+            players_by_id (dict): Dictionary mapping player IDs to Player objects.
+        Returns:
+            Match: The created Match object.
+        Raises:
+            ValueError: If the player IDs in the row are not found in the players_by_id dictionary.
+        """
+        def field(name: str, default: str) -> str:
+            i = columns.get(name)
+            return row[i] if i is not None and i < len(row) else default
+
+        match_id = row[columns["match_id"]]
+        white_id = int(row[columns["player_white_id"]])
+        black_id = int(row[columns["player_black_id"]])
         
         player_white = players_by_id.get(white_id)
         player_black = players_by_id.get(black_id) 
 
-        is_bye = data.get("is_bye_match", 'False').lower() == 'true'
-        is_half_bye = data.get("is_half_bye_match", 'False').lower() == 'true'
+        is_bye = field("is_bye_match", 'False').lower() == 'true'
+        is_half_bye = field("is_half_bye_match", 'False').lower() == 'true'
 
         if not player_white:
-            raise ValueError(f"Could not find white player for match ID {data['match_id']}. ID: {white_id}")
+            raise ValueError(f"Could not find white player for match ID {match_id}. ID: {white_id}")
         
         if is_bye and black_id == 0 and not player_black:
             player_black = Player(0, "BYE_OPPONENT", 0)
         elif not player_black and not is_bye:
-             raise ValueError(f"Could not find black player for match ID {data['match_id']}. ID: {black_id}")
+             raise ValueError(f"Could not find black player for match ID {match_id}. ID: {black_id}")
 
-        match = cls(int(data["match_id"]), player_white, player_black, int(data["round_number"]))
-        match.result = data["result"]
+        match = cls(int(match_id), player_white, player_black, int(row[columns["round_number"]]))
+        match.result = row[columns["result"]]
         match.is_bye_match = is_bye
         match.is_half_bye_match = is_half_bye
         return match
@@ -239,25 +390,94 @@ class Match:
 # --- Utility Functions ---
 class TournamentUtils:
     """Utility functions for tournament management."""
-    
-    @staticmethod
-    def now() -> str:
-        return datetime.datetime.now().strftime("%d/%m/%y %H:%M:%S")
+
+    # now() is formatted at most once per wall-clock second
+    _now_second: int = -1
+    _now_str: str = ""
+
+    @classmethod
+    def now(cls) -> str:
+        second = int(time.time())
+        if second != cls._now_second:
+            cls._now_str = datetime.datetime.fromtimestamp(second).strftime("%d/%m/%y %H:%M:%S")
+            cls._now_second = second
+        return cls._now_str
+
+    LONG_LINE: str = "--- " * 20
+
+    @classmethod
+    def long_line(cls) -> str:
+        return cls.LONG_LINE
 
     @staticmethod
-    def long_line() -> str:
-        return "--- " * 20
+    def ensure_parent_dir(filepath: str) -> None:
+        """Create the directory that will hold `filepath`; an existing directory costs a single stat call."""
+        directory = os.path.dirname(filepath) or '.'
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
 
 
 # --- Player Manager ---
 class PlayerManager:
     """Manages all player-related operations."""
+
+    # Final-standings tie-break: past result -> share of the opponent's points that counts.
+    # Byes ("B", "HB") are not listed and are skipped.
+    TIEBREAK_POINTS_FACTOR: Dict[str, float] = {
+        "W": 1.0,
+        "D": 0.5,
+        "L": 0.0, # don't give points for losses, the opponent's elo still counts
+    }
     
-    def __init__(self):
-        self.players: List[Player] = []
+    def __init__(self, verbose: bool = False):
+        self.verbose = verbose
+        self._players: List[Player] = []
+        self._players_by_id: Dict[int, Player] = {}
+        self._players_by_name: Dict[str, Player] = {}
+        self._standings_valid = False
+        # Player._points_generation the cached order was sorted at
+        self._standings_points_generation = -1
         self.next_player_id = 1
 
-    def add_player(self, name_surname: str, elo: int, id: int = -1) -> None:
+    @property
+    def players(self) -> List[Player]:
+        return self._players
+
+    @players.setter
+    def players(self, players: List[Player]) -> None:
+        self._players = players
+        self.reindex_players()
+        self.invalidate_standings()
+
+    @property
+    def players_by_id(self) -> Dict[int, Player]:
+        """Live ID -> Player index; treat it as read-only."""
+        return self._players_by_id
+
+    def reindex_players(self) -> None:
+        """Rebuild the ID and name indexes (call after appending to `players` directly)."""
+        self._players_by_id = {}
+        self._players_by_name = {}
+        for player in self._players:
+            self._players_by_id.setdefault(player.id, player)
+            if player.id != 0:
+                self._players_by_name.setdefault(player.name_surname.lower(), player)
+
+    def extend_players(self, players: List[Player]) -> None:
+        """Append already-built players in one go and index them (used by bulk loads)."""
+        self._players.extend(players)
+        for player in players:
+            self._players_by_id.setdefault(player.id, player)
+            if player.id != 0:
+                self._players_by_name.setdefault(player.name_surname.lower(), player)
+        self.update_next_player_id()
+        self.invalidate_standings()
+
+    def invalidate_standings(self) -> None:
+        """Mark the cached standings order as stale (call after ELO, color balance or roster changes; add_points does it by itself)."""
+        self._standings_valid = False
+
+    def add_player(self, name_surname: str, elo: int, id: int = -1, verbose: Optional[bool] = None) -> None:
         
         """
         Add a new player to the tournament or update an existing player's ELO.
@@ -267,6 +487,7 @@ class PlayerManager:
             elo (int): The ELO rating of the player.
             id (int, optional): The ID to assign to the player. If not provided or if the ID already exists,
                                 a new ID is generated.
+            verbose (bool, optional): Print a line for the added/updated player. Defaults to the manager's verbose.
 
         If a player with the same name_surname already exists, their ELO is updated to the provided value.
         Otherwise, a new Player object is created and added to the list of players.
@@ -275,26 +496,44 @@ class PlayerManager:
             id_to_use = self.next_player_id
         else:
             id_to_use = id
+        if verbose is None:
+            verbose = self.verbose
         
         existing_player = self.get_player_by_name(name_surname)
         if existing_player:
-            print(f"{TournamentUtils.now()} | Player '{name_surname}' already exists. Updating ELO from {existing_player.elo} to {elo}.")
+            if verbose:
+                print(f"{TournamentUtils.now()} | Player '{name_surname}' already exists. Updating ELO from {existing_player.elo} to {elo}.")
             existing_player.elo = elo
+            self.invalidate_standings()
         else:
             p = Player(id_to_use, name_surname, elo)
             self.players.append(p)
+            self._players_by_id[p.id] = p
+            if p.id != 0:
+                self._players_by_name[p.name_surname.lower()] = p
             self.update_next_player_id()
-            print(f"{TournamentUtils.now()} | Player added: {p.player_and_elo()}")
+            self.invalidate_standings()
+            if verbose:
+                print(f"{TournamentUtils.now()} | Player added: {p.player_and_elo()}")
+
+    def remove_player(self, player_id: int) -> Optional[Player]:
+        """Removes the player with the given ID and drops them from the indexes. Returns the removed player, or None."""
+        player = self._players_by_id.pop(player_id, None)
+        if player is None:
+            return None
+        self._players.remove(player)
+        name_key = player.name_surname.lower()
+        if self._players_by_name.get(name_key) is player:
+            del self._players_by_name[name_key]
+        self.update_next_player_id()
+        self.invalidate_standings()
+        return player
 
     def get_player_by_name(self, name_surname: str) -> Optional[Player]:
         """
         Arg:
         Returns the player with the given name_surname, or None if not found."""
-        name_surname = Player._name_surname_encoder(name_surname).lower()
-        for player in self.players:
-            if player.name_surname.lower() == name_surname and player.id != 0:
-                return player
-        return None
+        return self._players_by_name.get(Player._name_surname_encoder(name_surname).lower())
     
     def toggle_player_presence(self, player_id: int) -> str:
         player = self.get_player_by_id(player_id)
@@ -306,10 +545,7 @@ class PlayerManager:
 
     def get_player_by_id(self, player_id: int) -> Optional[Player]:
         """Rerutns the player with the given ID, or None if not found."""
-        for player in self.players:
-            if player.id == player_id:
-                return player
-        return None
+        return self._players_by_id.get(player_id)
 
     def get_all_players(self) -> List[Player]:
         return self.players.copy()
@@ -318,17 +554,16 @@ class PlayerManager:
         return [p for p in self.players if p.id != 0 and p.is_present] # Filter by is_present
 
     def update_next_player_id(self) -> None:
-        if self.players:
-            valid_player_ids = [p.id for p in self.players if p.id != 0]
-            if valid_player_ids:
-                self.next_player_id = max(valid_player_ids) + 1
-            else:
-                self.next_player_id = 1
-        else:
-            self.next_player_id = 1
+        # The ID index holds every registered ID; 0 is the BYE opponent
+        self.next_player_id = max(self._players_by_id.keys() - {0}, default=0) + 1
 
     def update_standings(self) -> None:
-        self.players.sort(key=lambda p: (p.points, -p.color_balance_counter, p.elo), reverse=True)
+        """Sort players by standings, skipping the sort while the cached order is still valid."""
+        if self._standings_valid and self._standings_points_generation == Player._points_generation:
+            return
+        self._players.sort(key=lambda p: (p.points, -p.color_balance_counter, p.elo), reverse=True)
+        self._standings_valid = True
+        self._standings_points_generation = Player._points_generation
 
     def get_final_standings(self, top: Optional[int] = None)-> list[Player]:
         if top is None:
@@ -345,51 +580,43 @@ class PlayerManager:
                 break
             scoregroups[player.points].append(player)
 
+        get_player = self._players_by_id.get
+        points_factor = self.TIEBREAK_POINTS_FACTOR
+        buchholz: Optional[Dict[int, float]] = None # computed once, only if a scoregroup needs it
         for scoregruop in scoregroups.values():
             if len(scoregruop) == 1:
                 final_standings.append(scoregruop[0])
                 continue
             #if there are more players in the scoregroup
+            if buchholz is None:
+                buchholz = self.get_buchholz_scores()
+            scoregroup_members = set(scoregruop) # for the head-to-head check
             players_and_avarage_opponent: dict[Player, float] = {
                 #Player object: the avarage opponents points
             }
             for player in scoregruop:
                 opponents_points: list[float] = []
                 for i, match_result in enumerate(player.past_results):
-                    match(match_result):
-                        case "B" | "HB":
-                            # skip bye matches
-                            continue
-                        case "L":
-                            # don't give points for losses
-                            opponents_points.append(0.0)
-                            # but we give some points for elo in any case (tie-breaker)
-                            opponents_points.append(self.get_player_by_id(player.past_opponents[i]).elo / 10000)
-                            continue
-                        case "W":
-                            opponent = self.get_player_by_id(player.past_opponents[i])
-                            # Prioritize Head-to-Head matches
-                            if opponent in scoregruop:
-                                opponents_points.append(opponent.points ** 2)
-                            else:
-                                opponents_points.append(opponent.points)
-
-                            opponents_points.append(opponent.elo / 10000)
-                            continue
-                        case "D":
-                            opponents_points.append(self.get_player_by_id(player.past_opponents[i]).points / 2)
-                            opponents_points.append(self.get_player_by_id(player.past_opponents[i]).elo / 10000)
-                            continue
-                        case _:
-                            pass
+                    factor = points_factor.get(match_result)
+                    if factor is None:
+                        # skip bye matches
+                        continue
+                    opponent = get_player(player.past_opponents[i])
+                    opponent_points = opponent.points
+                    # Prioritize Head-to-Head wins
+                    if match_result == "W" and opponent in scoregroup_members:
+                        opponent_points = opponent_points ** 2
+                    opponents_points.append(opponent_points * factor)
+                    # we give some points for elo in any case (tie-breaker)
+                    opponents_points.append(opponent.elo / 10000)
                 players_and_avarage_opponent[player] = 0.0
                 if opponents_points:
                     players_and_avarage_opponent[player] = (math.fsum(opponents_points) * 2) / len(opponents_points) 
 
-            #Sort the scoregroup by the sum of the opponents' points (descending), 
+            #Sort the scoregroup by the sum of the opponents' points (descending), then by Buchholz
             players_and_avarage_opponent: list[tuple[Player, float]] = sorted(
                 players_and_avarage_opponent.items(),
-                key=lambda x: x[1],
+                key=lambda item: (item[1], buchholz[item[0].id]),
                 reverse=True)
             
             final_standings.extend([x[0] for x in players_and_avarage_opponent])
@@ -399,6 +626,18 @@ class PlayerManager:
 
         return final_standings
 
+    def get_buchholz_scores(self) -> Dict[int, float]:
+        """Buchholz tie-break: the sum of the current points of every opponent a player has met.
+        Byes and opponents who are no longer registered are skipped.
+        Returns:
+            Dict[int, float]: Player ID -> Buchholz score.
+        """
+        # Byes (ID 0) and unregistered opponents count as 0 points
+        points_by_id = {p.id: p.points for p in self.players if p.id != 0}
+        get_points = points_by_id.get
+        return {p.id: sum((get_points(opponent_id, 0.0) for opponent_id in p.past_opponents), 0.0)
+                for p in self.players}
+
 
 # --- Pairing Engine ---
 class PairingEngine:
@@ -410,7 +649,7 @@ class PairingEngine:
 
     # For quadratic penalty (e.g., if played twice, 4x penalty):
     # REMATCH_PENALTY_QUADRATIC_FACTOR = 100.0 # Use this if you want quadratic penalty
-    # badness_matrix.loc[p1.id, p2.id] += self.REMATCH_PENALTY_QUADRATIC_FACTOR * (rematch_count ** 2)
+    # badness_matrix[i, j] += self.REMATCH_PENALTY_QUADRATIC_FACTOR * (rematch_count ** 2)
 
     ELO_DIFF_DIVISOR: float = 500.0
     # POSITION_FINE_TUNE_DIVISOR = 1000.0 # Tiny influence from index difference (if you want)
@@ -425,55 +664,71 @@ class PairingEngine:
     # If you want to ALWAYS find the absolute mathematically best pairing, set this to 0.0.
     MATCH_ACCEPTABLE_BADNESS_LIMIT:float = 3.0
 
+    # Max number of sub-pairings the recursive search remembers per `find_optimal_pairing` call
+    PAIRING_MEMO_LIMIT: int = 100_000
+
+    # Pair with Edmonds' blossom matching when networkx is installed.
+    # Set to False to force the recursive search (e.g. for debugging or comparing results).
+    USE_BLOSSOM_MATCHING: bool = True
+
     def __init__(self, player_manager: PlayerManager):
         self.player_manager = player_manager
+        # remaining positions -> (best pairing found, its badness) or (None, bound it failed to beat)
+        self._pairing_memo: Dict[int, Tuple[Optional[List[Tuple[int, int]]], float]] = {}
+
+    def _remember_subpairing(self, players_remaining: int, pairing: Optional[List[Tuple[int, int]]], badness: float) -> None:
+        if len(self._pairing_memo) < self.PAIRING_MEMO_LIMIT or players_remaining in self._pairing_memo:
+            self._pairing_memo[players_remaining] = (pairing, badness)
 
-    def _calculate_badness_matrix(self, players_list: List[Player], pairing_system: str) -> pd.DataFrame:
+    def _calculate_badness_matrix(self, players_list: List[Player], pairing_system: str) -> np.ndarray:
         
         """
         Creates a badness matrix for the given players, using a combination of penalties
         for rematches, point differences, and ELO differences.
-        The matrix is symmetric, but it generates only the upper triangle.
+        The whole matrix is built with NumPy broadcasting; only the rematch
+        marks are set per player.
         
         Args:
             players_list: List of Player objects to calculate the matrix for.
         
         Return:
-            A symmetric Pandas DataFrame with the badness of each possible pair.
+            A symmetric NumPy array indexed by position in `players_list`, with the badness
+            of each possible pair and inf on the diagonal.
         """
-        player_ids = [p.id for p in players_list]
-        # Initialize with inf, then fill.
-        badness_matrix = pd.DataFrame(float("inf"), index=player_ids[:-1], columns=player_ids)
-
-        for i, p1 in enumerate(players_list[:-1]):
-            for j, p2 in enumerate(players_list):
-                if i >= j: # Only calculate for the upper triangle and then mirror
-                    continue # Skip redundant calculations for lower triangle and diagonal
-
-                current_pair_badness: float = 0.0
-
-                # 1. Rematch penalty
-                if p2.id in p1.past_opponents:
-                    current_pair_badness += self.REMATCH_PENALTY
-                    # If you want quadratic penalty, uncomment the line below and the constant above:
-                    # rematch_count = p1.past_opponents.count(p2.id)
-                    # current_pair_badness += self.REMATCH_PENALTY_QUADRATIC_FACTOR * (rematch_count ** 2)
-
-                # 2. Points difference (squared)
-                current_pair_badness += (p1.points - p2.points) ** 2
-
-                # 3. ELO difference (divided by 500)
-                elo_diff = abs(p1.elo - p2.elo)
-                current_pair_badness += (elo_diff / self.ELO_DIFF_DIVISOR)
-
-                # Assign to both symmetrical cells
-                badness_matrix.loc[p1.id, p2.id] = current_pair_badness
-                #badness_matrix.loc[p2.id, p1.id] = current_pair_badness # Mirror the value
-                
+        n = len(players_list)
+        id_to_idx = {p.id: k for k, p in enumerate(players_list)}
+
+        # 1. Rematch penalty (once per pair, whoever's history holds it)
+        # Collect the (i, j) positions first and set them with one fancy-index assignment
+        rows: List[int] = []
+        cols: List[int] = []
+        for i, p in enumerate(players_list):
+            for opponent_id in p.past_opponents_set:
+                j = id_to_idx.get(opponent_id)
+                if j is not None:
+                    rows.append(i)
+                    cols.append(j)
+        badness_matrix = np.zeros((n, n), dtype=np.float64)
+        badness_matrix[rows, cols] = self.REMATCH_PENALTY
+        badness_matrix[cols, rows] = self.REMATCH_PENALTY
+        # If you want quadratic penalty, add REMATCH_PENALTY_QUADRATIC_FACTOR * (rematch_count ** 2)
+        # here, counting p.past_opponents instead of marking the set
+
+        # 2. Points difference (squared)
+        points = np.fromiter((p.points for p in players_list), dtype=np.float64, count=n)
+        badness_matrix += (points[:, None] - points[None, :]) ** 2
+
+        # 3. ELO difference (divided by 500)
+        elos = np.fromiter((p.elo for p in players_list), dtype=np.int64, count=n)
+        badness_matrix += np.abs(elos[:, None] - elos[None, :]) / self.ELO_DIFF_DIVISOR
+
+        # A player can't be paired with themselves
+        np.fill_diagonal(badness_matrix, np.inf)
+
         return badness_matrix
 
-    def _find_best_pairing_recursive(self, players_remaining: List[Player], badness_matrix: pd.DataFrame, 
-                                     current_best_total_badness: float, current_pairing_attempt: List[Tuple[Player, Player]]) -> Optional[Tuple[List[Tuple[Player, Player]], float]]:
+    def _find_best_pairing_recursive(self, players_remaining: int, badness_matrix: List[List[float]], 
+                                     current_best_total_badness: float, current_pairing_attempt: List[Tuple[int, int]]) -> Optional[Tuple[List[Tuple[int, int]], float]]:
         """
         Recursively searches for the best possible pairing of players by minimizing the total
         "badness" of all pairs.
@@ -483,46 +738,74 @@ class PairingEngine:
         prune the search space.
         
         Args:
-            players_remaining: List of Player objects that still need to be paired.
-            badness_matrix: Pandas DataFrame with the badness of each possible pair.
+            players_remaining: Bitmask of the positions (into the badness matrix) that still need to be
+                               paired: bit k set means player k is unpaired. Also the memo key.
+            badness_matrix: Badness of each possible pair as nested lists (`ndarray.tolist()`),
+                            which are much cheaper to index one scalar at a time than the array.
             current_best_total_badness: The best total badness found so far.
-            current_pairing_attempt: List of pairs that have been tried so far.
+            current_pairing_attempt: List of position pairs that have been tried so far.
         
         Returns:
-            A tuple containing the best pairing found and its total badness, or None if no valid
-            pairing was found.
+            A tuple containing the best pairing found (as position pairs) and its total badness,
+            or None if no valid pairing was found.
         """
         if not players_remaining:
             return ([], 0.0)
 
-        if len(players_remaining) == 2:
-            p1 = players_remaining[0]
-            p2 = players_remaining[1]
-            badness = badness_matrix.loc[p1.id, p2.id]
+        # The same subset is reached through many different prefixes; reuse earlier answers
+        cached = self._pairing_memo.get(players_remaining)
+        if cached is not None:
+            cached_pairing, cached_badness = cached
+            if cached_pairing is None:
+                if current_best_total_badness <= cached_badness: # failed against a looser bound before
+                    return None
+            elif cached_badness < current_best_total_badness:
+                return (cached_pairing, cached_badness)
+
+        positions = []
+        bits = players_remaining
+        while bits:
+            lowest_bit = bits & -bits
+            positions.append(lowest_bit.bit_length() - 1)
+            bits ^= lowest_bit
+
+        if len(positions) == 2:
+            p1, p2 = positions
+            badness = badness_matrix[p1][p2]
 
             if badness >= current_best_total_badness or badness > self.MATCH_BADNESS_LIMIT:
                 return None
             
             return ([(p1, p2)], badness)
 
+        search_bound = current_best_total_badness
+
         best_overall_pairing = None
         min_overall_badness = float("inf")
-        first_player = players_remaining[0]
+        # Lower bound: every remaining player pays at least half of their cheapest pair.
+        # If even that can't beat the best known total, no pairing of this subset can.
+        lower_bound = sum(
+            min(badness_matrix[p][q] for q in positions if q != p) for p in positions
+        ) / 2
+        if lower_bound >= current_best_total_badness:
+            self._remember_subpairing(players_remaining, None, search_bound)
+            return None
 
-        for i in range(1, len(players_remaining)):
-            current_partner = players_remaining[i]
-            pair_badness = badness_matrix.loc[first_player.id, current_partner.id]
+        first_player = positions[0]
+        first_player_row = badness_matrix[first_player] # fetched once per level
+
+        # Try the cheapest partners first, so the best known total drops (and prunes) early
+        for current_partner in sorted(positions[1:], key=first_player_row.__getitem__):
+            pair_badness = first_player_row[current_partner]
             
-            # This check is important: if a pair is impossible (inf), skip it.
+            # Partners are sorted by badness, so once a pair is impossible (inf), exceeds the
+            # best known total or exceeds the single match badness limit, so do all the rest.
             if pair_badness == float("inf"):
-                continue
-            
-            # Pruning: If this single pair's badness already exceeds the best known total
-            # or exceeds the single match badness limit, skip.
+                break
             if pair_badness >= current_best_total_badness or pair_badness > self.MATCH_BADNESS_LIMIT:
-                continue
+                break
 
-            remaining_players_for_recursion = players_remaining[1:i] + players_remaining[i+1:]
+            remaining_players_for_recursion = players_remaining & ~((1 << first_player) | (1 << current_partner))
             
             recursive_result = self._find_best_pairing_recursive(
                 remaining_players_for_recursion, 
@@ -541,13 +824,56 @@ class PairingEngine:
                     current_best_total_badness = min_overall_badness
                     
                     if self.MATCH_ACCEPTABLE_BADNESS_LIMIT is not None and min_overall_badness < self.MATCH_ACCEPTABLE_BADNESS_LIMIT:
+                        self._remember_subpairing(players_remaining, best_overall_pairing, min_overall_badness)
                         return (best_overall_pairing, min_overall_badness)
             
         if best_overall_pairing is None and min_overall_badness == float("inf"):
+            self._remember_subpairing(players_remaining, None, search_bound)
             return None
         
+        self._remember_subpairing(players_remaining, best_overall_pairing, min_overall_badness)
         return (best_overall_pairing, min_overall_badness)
 
+    def _find_best_pairing_blossom(self, players_list: List[Player], badness_matrix: np.ndarray) -> Optional[Tuple[List[Tuple[Player, Player]], float]]:
+        """
+        Finds the minimum total badness pairing as a minimum weight perfect matching,
+        using Edmonds' blossom algorithm from networkx (O(N^3) instead of a factorial search).
+        Pairs above MATCH_BADNESS_LIMIT are not allowed, same as in the recursive search.
+
+        Args:
+            players_list: Even-length list of Player objects to pair.
+            badness_matrix: Badness matrix from `_calculate_badness_matrix`.
+
+        Returns:
+            A tuple containing the pairing and its total badness, or None if no
+            complete pairing exists.
+        """
+        allowed_pairs: List[Tuple[int, int, float]] = []
+        for i in range(len(players_list) - 1):
+            for j in range(i + 1, len(players_list)):
+                badness = badness_matrix[i, j]
+                if badness == float("inf") or badness > self.MATCH_BADNESS_LIMIT:
+                    continue
+                allowed_pairs.append((i, j, badness))
+
+        if not allowed_pairs:
+            return None
+
+        # networkx maximises the total weight, so turn every badness into a positive "goodness"
+        offset = max(badness for _, _, badness in allowed_pairs) + 1.0
+        graph = nx.Graph()
+        graph.add_nodes_from(range(len(players_list)))
+        graph.add_weighted_edges_from((i, j, offset - badness) for i, j, badness in allowed_pairs)
+        matching = nx.max_weight_matching(graph, maxcardinality=True)
+
+        if len(matching) * 2 != len(players_list):
+            return None
+
+        index_pairs = sorted((min(i, j), max(i, j)) for i, j in matching)
+        pairing = [(players_list[i], players_list[j]) for i, j in index_pairs]
+        total_badness = sum(badness_matrix[i, j] for i, j in index_pairs)
+        return (pairing, total_badness)
+
     def find_optimal_pairing(self, players_to_pair: List[Player]) -> Optional[Tuple[List[Tuple[Player, Player]], float]]:
         if not players_to_pair:
             return ([], 0.0)
@@ -557,12 +883,20 @@ class PairingEngine:
         self.badness_matrix = self._calculate_badness_matrix(players_to_pair, "dutch")
         round_badness_limit = len(players_to_pair) * 4 # Adjusted limit to be more generous
 
-        result = self._find_best_pairing_recursive(
-            players_to_pair, 
-            self.badness_matrix, 
-            round_badness_limit,
-            []
-        )
+        if self.USE_BLOSSOM_MATCHING and nx is not None:
+            result = self._find_best_pairing_blossom(players_to_pair, self.badness_matrix)
+        else:
+            self._pairing_memo = {}
+            result = self._find_best_pairing_recursive(
+                (1 << len(players_to_pair)) - 1, 
+                self.badness_matrix.tolist(), 
+                round_badness_limit,
+                []
+            )
+            self._pairing_memo = {} # only valid for this matrix
+            if result:
+                index_pairs, total_badness = result
+                result = ([(players_to_pair[i], players_to_pair[j]) for i, j in index_pairs], total_badness)
         
         if result and result[1] <= round_badness_limit:
             return result
@@ -596,17 +930,27 @@ class PairingEngine:
 class MatchManager:
     """Manages matches and round scheduling."""
     
-    def __init__(self, player_manager: PlayerManager, pairing_engine: 'PairingEngine'): # Forward reference for PairingEngine
+    def __init__(self, player_manager: PlayerManager, pairing_engine: 'PairingEngine', verbose: bool = False): # Forward reference for PairingEngine
         self.player_manager = player_manager
         self.pairing_engine = pairing_engine
+        # Log every created match (print_pairings already shows the full round)
+        self.verbose = verbose
         self.rounds_matches: Dict[int, List[Match]] = {}
+        # round number -> {match ID: Match}, kept in sync with rounds_matches
+        self._matches_by_id: Dict[int, Dict[int, Match]] = {}
         self.next_match_id_in_round = 1
 
     def get_match_by_round_and_id(self, round_number: int, match_id: int) -> Optional[Match]:
-        for match in self.rounds_matches.get(round_number, []):
-            if match.round_number == round_number and match.match_id == match_id:
-                return match
-        return None
+        return self._matches_by_id.get(round_number, {}).get(match_id)
+
+    def register_match(self, match: Match) -> None:
+        """Store a match in its round and in the ID index."""
+        self.rounds_matches.setdefault(match.round_number, []).append(match)
+        self._matches_by_id.setdefault(match.round_number, {}).setdefault(match.match_id, match)
+
+    def clear_matches(self) -> None:
+        self.rounds_matches = {}
+        self._matches_by_id = {}
     
     def create_match(self, player_white: Player, player_black: Optional[Player], round_number: int, is_half_bye: bool = False) -> Match:
         match = Match(self.next_match_id_in_round, player_white, player_black, round_number)
@@ -623,16 +967,20 @@ class MatchManager:
                 player_white.has_bye_this_round = True # Mark for current round
             player_white.past_matches.append(match.match_id)
             player_white.past_opponents.append(0)
+            player_white.past_opponents_set.add(0)
         else:
             player_white.past_opponents.append(player_black.id)
             player_black.past_opponents.append(player_white.id)
+            player_white.past_opponents_set.add(player_black.id)
+            player_black.past_opponents_set.add(player_white.id)
             player_white.past_colors.append("white")
             player_black.past_colors.append("black")
             player_white.past_matches.append(match.match_id)
             player_black.past_matches.append(match.match_id)
 
-        self.rounds_matches.setdefault(round_number, []).append(match)
-        print(f"{TournamentUtils.now()} | Added match: {match}")
+        self.register_match(match)
+        if self.verbose:
+            print(f"{TournamentUtils.now()} | Added match: {match}")
         return match
 
     def get_eligible_bye_player(self, players_pool: List[Player]) -> Optional[Player]:
@@ -640,9 +988,10 @@ class MatchManager:
         if not eligible_for_regular_bye:
             return None
 
-        eligible_for_regular_bye.sort(key=lambda p: (p.points, p.elo))
-        lowest_point = eligible_for_regular_bye[0].points
+        # One pass for the lowest score; only the tied players are ordered (by ELO) for the draw
+        lowest_point = min(p.points for p in eligible_for_regular_bye)
         tied_players = [p for p in eligible_for_regular_bye if p.points == lowest_point]
+        tied_players.sort(key=_ELO)
         
         return random.choice(tied_players)
 
@@ -674,8 +1023,8 @@ class MatchManager:
                 print(f"{TournamentUtils.now()} | Player {bye_player.name_surname} receives a REGULAR BYE (1.0 pt) in Round {round_number}.")
             else:
                 # Fallback to Half Bye if no one eligible for Regular Bye
-                players_for_pairing.sort(key=lambda p: (p.points, p.elo))
-                half_bye_player = players_for_pairing.pop(0) # Take the lowest-rated player
+                half_bye_player = min(players_for_pairing, key=_POINTS_ELO) # Take the lowest-rated player
+                players_for_pairing.remove(half_bye_player)
                 
                 half_bye_player.add_points(0.5)
                 # has_bye_this_round is set in create_match
@@ -695,22 +1044,31 @@ class MatchManager:
 # --- Result Tracker ---
 class ResultTracker:
     """Manages match results and scoring."""
+
+    # result -> (white points, black points, white past result, black past result)
+    GAME_RESULTS: Dict[str, Tuple[float, float, str, str]] = {
+        "1-0": (1.0, 0.0, "W", "L"),
+        "0-1": (0.0, 1.0, "L", "W"),
+        "0.5-0.5": (0.5, 0.5, "D", "D"),
+    }
+    # result -> past result of the bye player (points are already added in handle_bye_assignment)
+    BYE_RESULTS: Dict[str, str] = {
+        "bye": "B",
+        "half bye": "HB",
+    }
     
-    def __init__(self, match_manager: MatchManager, player_manager: PlayerManager):
+    def __init__(self, match_manager: MatchManager, player_manager: PlayerManager, verbose: bool = False):
         self.match_manager = match_manager
         self.player_manager = player_manager
+        self.verbose = verbose
 
-    def enter_result(self, match_id: int, result: str, round_num: int) -> None:
+    def enter_result(self, match_id: int, result: str, round_num: int, verbose: Optional[bool] = None) -> None:
         matches_in_round = self.match_manager.get_matches_for_round(round_num)
         if not matches_in_round:
             print(f"{TournamentUtils.now()} | Error: No matches found for Round {round_num}.")
             return
 
-        match_found = None
-        for match in matches_in_round:
-            if match.match_id == match_id:
-                match_found = match
-                break
+        match_found = self.match_manager.get_match_by_round_and_id(round_num, match_id)
         
         if not match_found:
             print(f"{TournamentUtils.now()} | Error: Match ID {match_id} not found in Round {round_num}.")
@@ -726,64 +1084,86 @@ class ResultTracker:
             print(f"{TournamentUtils.now()} | Error setting result for Match ID {match_id} (R{round_num}): {e}")
             return
     
-        print(f"{TournamentUtils.now()} | Match ID {match_id} (R{round_num}) result set to {result}.")
+        if verbose if verbose is not None else self.verbose:
+            print(f"{TournamentUtils.now()} | Match ID {match_id} (R{round_num}) result set to {result}.")
 
     def update_players_results(self, matches: List[Match]) -> None:
         for m in matches:
-            match(m.result.lower()):
-                case "1-0":
-                    m.player_white.add_points(1.0)
-                    m.player_white.past_results.append("W")
-                    m.player_black.past_results.append("L")
-                    m.player_black.color_balance_counter -= 1
-                    m.player_white.color_balance_counter += 1
-                case "0-1":
-                    m.player_black.add_points(1.0)
-                    m.player_white.past_results.append("L")
-                    m.player_black.past_results.append("W")
-                    m.player_black.color_balance_counter -= 1
-                    m.player_white.color_balance_counter += 1
-                case "0.5-0.5":
-                    m.player_black.add_points(0.5)
-                    m.player_white.add_points(0.5)
-                    m.player_white.past_results.append("D")
-                    m.player_black.past_results.append("D")
-                    m.player_black.color_balance_counter -= 1
-                    m.player_white.color_balance_counter += 1
-                case "bye":
-                    #points are already added in handle_bye_assignment
-                    m.player_white.past_results.append("B")
-                case "half bye":
-                    m.player_white.past_results.append("HB")
-                case _:
-                    try:
-                        m.player_white.past_results.append(m.result)
-                        m.player_black.past_results.append(m.result)
-                    except:
-                        print(f"{TournamentUtils.now()} | Error: Unrecognized result '{m.result}'. No points awarded.")
+            result = m.result.lower()
+            game = self.GAME_RESULTS.get(result)
+            if game is not None:
+                white_points, black_points, white_result, black_result = game
+                white, black = m.player_white, m.player_black
+                white.add_points(white_points)
+                black.add_points(black_points)
+                white.past_results.append(white_result)
+                black.past_results.append(black_result)
+                white.color_balance_counter += 1
+                black.color_balance_counter -= 1
+                continue
+
+            bye_result = self.BYE_RESULTS.get(result)
+            if bye_result is not None:
+                m.player_white.past_results.append(bye_result)
+                continue
+
+            try:
+                m.player_white.past_results.append(m.result)
+                m.player_black.past_results.append(m.result)
+            except:
+                print(f"{TournamentUtils.now()} | Error: Unrecognized result '{m.result}'. No points awarded.")
+        # Points invalidate the standings by themselves; the color balance changes do not
+        self.player_manager.invalidate_standings()
             
 
 # --- File Manager ---
 class FileManager:
     """Handles all file I/O operations."""
+
+    MATCH_FIELDS: Tuple[str, ...] = Match.CSV_FIELDS
+    META_FIELDS: Tuple[str, ...] = ("current_round", "num_rounds", "next_player_id", "next_match_id_in_round_counter")
     
     def __init__(self, player_manager: PlayerManager, match_manager: MatchManager):
         self.player_manager = player_manager
         self.match_manager = match_manager
 
-    def save_players_to_csv(self, filepath: str = "players.csv") -> None:
-        os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+    @staticmethod
+    def _read_text(filepath: str) -> io.StringIO:
+        """Read a saved CSV as text for `csv.reader`: UTF-8 first, then the legacy encodings older saves may use.
+        The whole file is read in one call, so the encoding can be picked before any row is parsed."""
+        with open(filepath, "rb") as file:
+            data = file.read()
+        try:
+            text = data.decode("utf-8")
+        except UnicodeDecodeError:
+            # Older saves used the platform default encoding (cp1252 on Windows);
+            # latin-1 maps every byte, so the last fallback cannot fail
+            try:
+                text = data.decode("cp1252")
+            except UnicodeDecodeError:
+                text = data.decode("latin-1")
+        return io.StringIO(text, newline="")
 
-        with open(filepath, "w", newline='') as file:
-            fieldnames = ["id", "name_surname", "elo", "points", "past_colors", 
-                          "past_matches", "past_opponents", "had_regular_bye", "has_bye_this_round", "is_present", "color_balance_counter", "past_results"]
-            writer = csv.DictWriter(file, fieldnames=fieldnames)
-            
-            writer.writeheader()
-            for player in self.player_manager.get_all_players():
-                if player.id == 0 and player.name_surname == "BYE_OPPONENT":
-                    continue
-                writer.writerow(player.to_dict())
+    @staticmethod
+    def _report_skipped_rows(kind: str, filepath: str, skipped_rows: List[str], shown: int = 5) -> None:
+        """Print one summary line for the rows a load had to skip, instead of one line per row."""
+        if not skipped_rows:
+            return
+        details = "; ".join(skipped_rows[:shown])
+        if len(skipped_rows) > shown:
+            details += f"; ... and {len(skipped_rows) - shown} more"
+        print(f"{TournamentUtils.now()} | Warning: skipped {len(skipped_rows)} invalid {kind} row(s) in {filepath} ({details}).")
+
+    def save_players_to_csv(self, filepath: str = "players.csv") -> None:
+        TournamentUtils.ensure_parent_dir(filepath)
+
+        with open(filepath, "w", newline="", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as file:
+            writer = csv.writer(file)
+            writer.writerow(Player.CSV_FIELDS)
+            writer.writerows(
+                player.to_row() for player in self.player_manager.players
+                if not (player.id == 0 and player.name_surname == "BYE_OPPONENT")
+            )
             print(f"{TournamentUtils.now()} | Players saved to {filepath}!")
 
     def load_players_from_csv(self, filepath: str = "registered_players.csv", clear_players: bool = True) -> None:
@@ -796,53 +1176,66 @@ class FileManager:
         if clear_players:
             self.player_manager.players = []
 
-        with open(filepath, "r", newline='') as file:
-            reader = csv.DictReader(file)
+        with FileManager._read_text(filepath) as file:
+            loaded_players = []
+            skipped_rows: List[str] = []
+            reader = csv.reader(file)
+            header = next(reader, [])
+            columns = {name: i for i, name in enumerate(header)}
             for row in reader:
+                if not row: # DictReader used to skip blank lines too
+                    continue
                 try:
-                    self.player_manager.players.append(Player.from_dict(row))
-                except (ValueError, KeyError, json.JSONDecodeError, TypeError) as e:
-                    print(f"{TournamentUtils.now()} | Error loading player from row {row}: {e}. Skipping row.")
-        
-        self.player_manager.update_next_player_id()
+                    loaded_players.append(Player.from_row(row, columns))
+                except (ValueError, KeyError, IndexError, json.JSONDecodeError, TypeError) as e:
+                    skipped_rows.append(f"line {reader.line_num}: {e}")
+
+        self.player_manager.extend_players(loaded_players)
+        FileManager._report_skipped_rows("player", filepath, skipped_rows)
         print(f"{TournamentUtils.now()} | Players loaded from {filepath}!")
 
     def save_matches_to_csv(self, filepath: str = "matches.csv") -> None:
-        os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
-        with open(filepath, 'w', newline='') as f:
-            fieldnames = ["match_id", "round_number", "player_white_id", "player_black_id", "result", "is_bye_match", "is_half_bye_match"]
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for round_num in sorted(self.match_manager.rounds_matches.keys()):
-                for match in self.match_manager.rounds_matches[round_num]:
-                    writer.writerow(match.to_dict())
+        TournamentUtils.ensure_parent_dir(filepath)
+        with open(filepath, "w", newline="", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(self.MATCH_FIELDS)
+            writer.writerows(
+                match.to_row()
+                for round_num in sorted(self.match_manager.rounds_matches.keys())
+                for match in self.match_manager.rounds_matches[round_num]
+            )
         print(f"{TournamentUtils.now()} | Matches saved to {filepath}!")
 
     def load_matches_from_csv(self, filepath: str = "matches.csv") -> None:
         if not os.path.exists(filepath) or os.path.getsize(filepath) == 0:
             print(f"{TournamentUtils.now()} | No match data file '{filepath}' found. No matches loaded.")
-            self.match_manager.rounds_matches = {}
+            self.match_manager.clear_matches()
             return
 
-        players_by_id = {p.id: p for p in self.player_manager.get_all_players()}
-        self.match_manager.rounds_matches = {}
+        players_by_id = self.player_manager.players_by_id
+        self.match_manager.clear_matches()
         
-        with open(filepath, 'r', newline='') as f:
-            reader = csv.DictReader(f)
+        with FileManager._read_text(filepath) as f:
+            skipped_rows: List[str] = []
+            reader = csv.reader(f)
+            header = next(reader, [])
+            columns = {name: i for i, name in enumerate(header)}
             for row in reader:
+                if not row:
+                    continue
                 try:
-                    match = Match.from_dict(row, players_by_id)
-                    self.match_manager.rounds_matches.setdefault(match.round_number, []).append(match)
-                except (KeyError, ValueError, TypeError) as e:
-                    print(f"{TournamentUtils.now()} | Error loading match from row {row}: {e}. Skipping match.")
+                    match = Match.from_row(row, columns, players_by_id)
+                    self.match_manager.register_match(match)
+                except (KeyError, ValueError, TypeError, IndexError) as e:
+                    skipped_rows.append(f"line {reader.line_num}: {e}")
+        FileManager._report_skipped_rows("match", filepath, skipped_rows)
         print(f"{TournamentUtils.now()} | Matches loaded from {filepath}!")
 
     def save_tournament_meta(self, current_round: int, num_rounds: int, next_player_id: int, 
                            next_match_id: int, filepath: str = "tournament_meta.csv") -> None:
-        os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
-        with open(filepath, 'w', newline='') as f:
-            fieldnames = ["current_round", "num_rounds", "next_player_id", "next_match_id_in_round_counter"]
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
+        TournamentUtils.ensure_parent_dir(filepath)
+        with open(filepath, "w", newline="", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as f:
+            writer = csv.DictWriter(f, fieldnames=self.META_FIELDS)
             writer.writeheader()
             writer.writerow({
                 "current_round": current_round,
@@ -857,7 +1250,7 @@ class FileManager:
             print(f"{TournamentUtils.now()} | No metadata file '{filepath}' found.")
             return None
 
-        with open(filepath, 'r', newline='') as f:
+        with FileManager._read_text(filepath) as f:
             reader = csv.DictReader(f)
             try:
                 meta_data = next(reader)
@@ -875,6 +1268,8 @@ class FileManager:
 # --- Display Manager ---
 class DisplayManager:
     """Handles all display and export operations."""
+
+    STANDINGS_FIELDS: Tuple[str, ...] = ("Rank", "Player Name", "ELO", "Points", "Had Regular Bye", "Had Half Bye This Round", "Is Present", "Color Balance Counter", "Buchholz")
     
     def __init__(self, player_manager: PlayerManager, match_manager: MatchManager):
         self.player_manager = player_manager
@@ -899,29 +1294,23 @@ class DisplayManager:
 
     def print_standings(self, current_round: int, num_rounds: int, top: Optional[int] = None) -> None:
         self.player_manager.update_standings()
-        print(f"\n--- {TournamentUtils.now()} | Current Standings (Round {current_round} / {num_rounds}) ---")
-        print(f"{'Rank':<5} {'Player Name':<20} {'ELO':<6} {'Points':<7} {'Bye':<5} {'Present':<7} {'Color Bal.':<10}")
-        print("-" * 80)
-        rank = 1
-        # Filter out BYE_OPPONENT and then apply 'top' limit
-        display_players = [p for p in self.player_manager.players if not (p.id == 0 and p.name_surname == "BYE_OPPONENT")]
-        
-        if top is None:
-            top = len(display_players)
-
-        for player in display_players:
-            if rank > top:
-                break
-            bye_status = "No"
-            if player.had_regular_bye:
-                bye_status = "Reg"
-            if player.has_bye_this_round: # This indicates a bye for the current round (could be half or regular)
-                bye_status = "Half" if not player.had_regular_bye else "Reg" # Refine if it's a half or regular bye for display
-            
-            present_status = "Yes" if player.is_present else "No"
-            print(f"{rank:<5} {player.name_surname:<20} {player.elo:<6} {player.points:<7.1f} {bye_status:<5} {present_status:<7} {player.color_balance_counter:<10}")
-            rank += 1
-        print("-" * 80)
+        # Collect the table and write it to stdout in one call
+        lines = [
+            f"\n--- {TournamentUtils.now()} | Current Standings (Round {current_round} / {num_rounds}) ---",
+            f"{'Rank':<5} {'Player Name':<20} {'ELO':<6} {'Points':<7} {'Bye':<5} {'Present':<7} {'Color Bal.':<10}",
+            "-" * 80,
+        ]
+        # Filter out BYE_OPPONENT and then apply 'top' limit, so only printed rows are visited
+        display_players = (p for p in self.player_manager.players if not (p.id == 0 and p.name_surname == "BYE_OPPONENT"))
+        if top is not None:
+            display_players = itertools.islice(display_players, max(top, 0))
+
+        for rank, player in enumerate(display_players, 1):
+            bye_status = _BYE_LABEL[(player.had_regular_bye, player.has_bye_this_round)]
+            present_status = _YES_NO[player.is_present]
+            lines.append(f"{rank:<5} {player.name_surname:<20} {player.elo:<6} {player.points:<7.1f} {bye_status:<5} {present_status:<7} {player.color_balance_counter:<10}")
+        lines.append("-" * 80)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def print_pairings(self, round_number: int) -> None:
         matches_to_print = self.match_manager.get_matches_for_round(round_number)
@@ -929,94 +1318,113 @@ class DisplayManager:
             print(f"{TournamentUtils.now()} | No pairings found for Round {round_number}.")
             return
         
-        print(f"\n--- {TournamentUtils.now()} | Pairings for Round {round_number} ---")
-        for match in matches_to_print:
-            print(match)
-        print("-" * 30)
+        lines = [f"\n--- {TournamentUtils.now()} | Pairings for Round {round_number} ---"]
+        lines.extend(map(str, matches_to_print))
+        lines.append("-" * 30)
+        sys.stdout.write("\n".join(lines) + "\n")
 
-    def export_standings_to_txt(self, current_round: int, num_rounds: int, filepath: str = "standings.txt") -> None:
-        os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
-        self.player_manager.update_standings()
-
-        with open(filepath, "w") as file:
-            file.write(f"--- {TournamentUtils.now()} | Current Standings (Round {current_round} / {num_rounds}) ---\n")
-            file.write(f"{'Rank':<5} {'Player Name':<25} {'ELO':<6} {'Points':<7} {'Bye':<5} {'Present':<8} {'Color Bal.':<10}\n")
-            file.write("-" * 80 + "\n")
-            rank = 1
-            display_players = [p for p in self.player_manager.players if not (p.id == 0 and p.name_surname == "BYE_OPPONENT")]
-            for player in display_players:
-                bye_status = "No"
-                if player.had_regular_bye:
-                    bye_status = "Reg"
-                if player.has_bye_this_round:
-                    bye_status = "Half" if not player.had_regular_bye else "Reg"
-                present_status = "Yes" if player.is_present else "No"
-                file.write(f"{rank:<5} {player.name_surname:<25} {player.elo:<6} {player.points:<7.1f} {bye_status:<5} {present_status:<8} {player.color_balance_counter:<10}\n")
-                rank += 1
-            file.write("-" * 80 + "\n")
-        print(f"{TournamentUtils.now()} | Standings exported to {filepath}!")
-
-    def export_standings_to_csv(self, filepath: str = "standings.csv") -> None:
-        os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+    def _ranked_standings(self) -> List[Tuple[int, Player]]:
+        """(rank, player) pairs in standings order, without the bye placeholder; shared by the TXT and CSV exports."""
         self.player_manager.update_standings()
+        display_players = (p for p in self.player_manager.players if not (p.id == 0 and p.name_surname == "BYE_OPPONENT"))
+        return list(enumerate(display_players, 1))
+
+    def export_standings_to_txt(self, current_round: int, num_rounds: int, filepath: str = "standings.txt",
+                                ranked: Optional[List[Tuple[int, Player]]] = None) -> None:
+        TournamentUtils.ensure_parent_dir(filepath)
+        if ranked is None:
+            ranked = self._ranked_standings()
+        now = TournamentUtils.now()
+
+        # Build the whole report first and hand it to the (1 MiB) buffered file in one writelines call
+        lines = [
+            f"--- {now} | Current Standings (Round {current_round} / {num_rounds}) ---\n",
+            f"{'Rank':<5} {'Player Name':<25} {'ELO':<6} {'Points':<7} {'Bye':<5} {'Present':<8} {'Color Bal.':<10}\n",
+            "-" * 80 + "\n",
+        ]
+        for rank, player in ranked:
+            bye_status = _BYE_LABEL[(player.had_regular_bye, player.has_bye_this_round)]
+            present_status = _YES_NO[player.is_present]
+            lines.append(_STANDINGS_ROW_FMT.format(rank, player.name_surname, player.elo, player.points, bye_status, present_status, player.color_balance_counter))
+        lines.append("-" * 80 + "\n")
+
+        with open(filepath, "w", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as file:
+            file.writelines(lines)
+        print(f"{now} | Standings exported to {filepath}!")
+
+    def export_standings_to_csv(self, filepath: str = "standings.csv",
+                                ranked: Optional[List[Tuple[int, Player]]] = None) -> None:
+        TournamentUtils.ensure_parent_dir(filepath)
+        if ranked is None:
+            ranked = self._ranked_standings()
         
-        with open(filepath, "w", newline='') as file:
-            fieldnames = ["Rank", "Player Name", "ELO", "Points", "Had Regular Bye", "Had Half Bye This Round", "Is Present", "Color Balance Counter"]
-            writer = csv.DictWriter(file, fieldnames=fieldnames)
-            writer.writeheader()
-            rank = 1
-            display_players = [p for p in self.player_manager.players if not (p.id == 0 and p.name_surname == "BYE_OPPONENT")]
-            for player in display_players:
-                writer.writerow({
-                    "Rank": rank,
-                    "Player Name": player.name_surname,
-                    "ELO": player.elo,
-                    "Points": player.points,
-                    "Had Regular Bye": "Yes" if player.had_regular_bye else "No",
-                    "Had Half Bye This Round": "Yes" if player.has_bye_this_round else "No",
-                    "Is Present": "Yes" if player.is_present else "No",
-                    "Color Balance Counter": player.color_balance_counter
-                })
-                rank += 1
+        with open(filepath, "w", newline="", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as file:
+            writer = csv.writer(file)
+            writer.writerow(self.STANDINGS_FIELDS)
+            buchholz = self.player_manager.get_buchholz_scores()
+            # One tuple per player, in STANDINGS_FIELDS order
+            writer.writerows(
+                (
+                    rank,
+                    player.name_surname,
+                    player.elo,
+                    player.points,
+                    _YES_NO[player.had_regular_bye],
+                    _YES_NO[player.has_bye_this_round],
+                    _YES_NO[player.is_present],
+                    player.color_balance_counter,
+                    buchholz.get(player.id, 0.0)
+                )
+                for rank, player in ranked
+            )
         print(f"{TournamentUtils.now()} | Standings exported to {filepath}!")
 
+    def export_standings(self, current_round: int, num_rounds: int,
+                         txt_filepath: str = "standings.txt", csv_filepath: str = "standings.csv") -> None:
+        """Export the TXT and CSV standings from one ranked list (one sort and filter for both files)."""
+        ranked = self._ranked_standings()
+        self.export_standings_to_txt(current_round, num_rounds, txt_filepath, ranked)
+        self.export_standings_to_csv(csv_filepath, ranked)
+
     def export_pairings_to_txt(self, round_number: int, filepath: str = "pairings.txt") -> None:
         matches_to_export = self.match_manager.get_matches_for_round(round_number)
         if not matches_to_export:
             print(f"{TournamentUtils.now()} | No pairings found for Round {round_number} to export.")
             return
 
-        os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
-        with open(filepath, "w") as file:
-            file.write(f"--- {TournamentUtils.now()} | Tournament Pairings for Round {round_number} ---\n")
-            for match in matches_to_export:
-                file.write(str(match) + "\n")
-            file.write("-" * 40 + "\n")
-        print(f"{TournamentUtils.now()} | Pairings for Round {round_number} exported to {filepath}!")
+        TournamentUtils.ensure_parent_dir(filepath)
+        now = TournamentUtils.now()
+        lines = [f"--- {now} | Tournament Pairings for Round {round_number} ---\n"]
+        lines.extend(f"{match}\n" for match in matches_to_export)
+        lines.append("-" * 40 + "\n")
+        with open(filepath, "w", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as file:
+            file.write("".join(lines))
+        print(f"{now} | Pairings for Round {round_number} exported to {filepath}!")
 
 
 # --- Tournament (Main Controller) ---
 class Tournament:
     """Main controller that coordinates all tournament operations."""
     
-    def __init__(self, num_rounds: int = 5):
+    def __init__(self, num_rounds: int = 5, verbose: bool = False):
         if not isinstance(num_rounds, int) or num_rounds <= 0:
             raise ValueError("Number of rounds must be a positive integer.")
         
         self.current_round = 0
         self.num_rounds = num_rounds
+        self.verbose = verbose
         
         # Initialize all managers
-        self.player_manager = PlayerManager()
+        self.player_manager = PlayerManager(verbose)
         self.pairing_engine = PairingEngine(self.player_manager)
-        self.match_manager = MatchManager(self.player_manager, self.pairing_engine)
-        self.result_tracker = ResultTracker(self.match_manager, self.player_manager)
+        self.match_manager = MatchManager(self.player_manager, self.pairing_engine, verbose)
+        self.result_tracker = ResultTracker(self.match_manager, self.player_manager, verbose)
         self.file_manager = FileManager(self.player_manager, self.match_manager)
         self.display_manager = DisplayManager(self.player_manager, self.match_manager)
 
     # Delegate methods to appropriate managers
-    def add_player(self, name_surname: str, elo: int, id: int = -1) -> None:
-        self.player_manager.add_player(name_surname, elo, id)
+    def add_player(self, name_surname: str, elo: int, id: int = -1, verbose: Optional[bool] = None) -> None:
+        self.player_manager.add_player(name_surname, elo, id, verbose)
 
     def get_player_by_name(self, name_surname: str) -> Optional[Player]:
         return self.player_manager.get_player_by_name(name_surname)
@@ -1028,33 +1436,34 @@ class Tournament:
         return self.player_manager.toggle_player_presence(player_id)
 
     def pair_round_random(self, round_number: int, players_for_pairing: List[Player]) -> List[Match]:
-        print(f"\n{TournamentUtils.long_line()}")
+        print(f"\n{TournamentUtils.LONG_LINE}")
         print(f"{TournamentUtils.now()} | Pairing Round {round_number} using RANDOM SYSTEM")
         random.shuffle(players_for_pairing)
-        for i in range(0, len(players_for_pairing), 2):
-            player1 = players_for_pairing[i]
-            player2 = players_for_pairing[i+1]
+        for player1, player2 in zip(players_for_pairing[0::2], players_for_pairing[1::2]):
             self.match_manager.create_match(player1, player2, round_number)
         return self.match_manager.get_matches_for_round(round_number)
 
     def pair_round_by_elo(self, round_number: int, players_for_pairing: List[Player]) -> List[Match]:
-        print(f"\n{TournamentUtils.long_line()}")
+        print(f"\n{TournamentUtils.LONG_LINE}")
         print(f"{TournamentUtils.now()} | Pairing Round {round_number} BY ELO")
-        players_for_pairing.sort(key=lambda p: p.elo)
-        mid = len(players_for_pairing) // 2
-        for i in range(0, len(players_for_pairing), 1):
-            player1 = players_for_pairing[i]
-            player2 = players_for_pairing[i+mid]
-            if i % 2 == 0:
-                self.match_manager.create_match(player1, player2, round_number)
+        # Swiss first-round split: the top half (by ELO) meets the bottom half in seed order
+        elos = np.fromiter((p.elo for p in players_for_pairing), dtype=np.int64, count=len(players_for_pairing))
+        order = np.argsort(-elos, kind="stable").tolist()
+        mid = len(order) // 2
+        for board, (top_idx, bottom_idx) in enumerate(zip(order[:mid], order[mid:2 * mid])):
+            top_player = players_for_pairing[top_idx]
+            bottom_player = players_for_pairing[bottom_idx]
+            # Alternate colors board by board
+            if board % 2 == 0:
+                self.match_manager.create_match(top_player, bottom_player, round_number)
             else:
-                self.match_manager.create_match(player2, player1, round_number)
+                self.match_manager.create_match(bottom_player, top_player, round_number)
         return self.match_manager.get_matches_for_round(round_number)
 
     def pair_round_matrix(self, round_number: int, players_for_pairing: List[Player], matrix_engine: PairingEngine | None = None) -> List[Match]:
-        print(f"\n{TournamentUtils.long_line()}")
+        print(f"\n{TournamentUtils.LONG_LINE}")
         print(f"{TournamentUtils.now()} | Pairing Round {round_number} using MATRIX SYSTEM")
-        players_for_pairing.sort(key=lambda p: (p.points, p.elo), reverse=True)
+        players_for_pairing.sort(key=_POINTS_ELO, reverse=True)
         if matrix_engine is None:
             matrix_engine = self.match_manager.pairing_engine
 
@@ -1077,11 +1486,11 @@ class Tournament:
         self.current_round += 1
         self.match_manager.reset_match_id_counter()
 
-        print(f"\n{TournamentUtils.long_line()}")
+        print(f"\n{TournamentUtils.LONG_LINE}")
         print(f"{TournamentUtils.now()} | Pairing Round {self.current_round} / {self.num_rounds} using {pairing_system.upper()} system.")
 
         # Reset has_bye_this_round for all players at the start of a new round
-        for p in self.player_manager.get_all_players():
+        for p in self.player_manager.players:
             p.has_bye_this_round = False
 
         active_players = self.player_manager.get_active_players()
@@ -1111,24 +1520,27 @@ class Tournament:
             case _:
                 raise ValueError(f"Invalid pairing system: {pairing_system}")
 
-    def enter_result(self, match_id: int, result: str, round_num: Optional[int] = None) -> None:
+    def enter_result(self, match_id: int, result: str, round_num: Optional[int] = None, verbose: Optional[bool] = None) -> None:
         if round_num is None:
-            self.result_tracker.enter_result(match_id, result, self.current_round)
-        self.result_tracker.enter_result(match_id, result, round_num)
+            round_num = self.current_round
+        self.result_tracker.enter_result(match_id, result, round_num, verbose)
 
     def end_round(self) -> None:
-        print(f"\n{TournamentUtils.long_line()}")
+        print(f"\n{TournamentUtils.LONG_LINE}")
         print(f"{TournamentUtils.now()} | Ending Round {self.current_round} / {self.num_rounds}")
 
         self.result_tracker.update_players_results(self.match_manager.get_matches_for_round(self.current_round))
         
         self.player_manager.update_standings()
         print(f"{TournamentUtils.now()} | Round {self.current_round} / {self.num_rounds} ended.")
-        print(TournamentUtils.long_line())
+        print(TournamentUtils.LONG_LINE)
 
     def get_final_standings(self, top: Optional[int] = None)-> list[Player]:
         return self.player_manager.get_final_standings(top)
 
+    def get_buchholz_scores(self) -> Dict[int, float]:
+        return self.player_manager.get_buchholz_scores()
+
     def end_tournament(self, top: Optional[int] = None) -> None:
         self.get_final_standings(top)
         print(f"{TournamentUtils.now()} | Tournament ended. Standings exported to 'standings.txt' and 'standings.csv'")
@@ -1197,6 +1609,25 @@ class Tournament:
         self.file_manager.load_matches_from_csv(matches_filepath)
         print(f"{TournamentUtils.now()} | Tournament state fully loaded!")
 
+    def export_all(self, dirpath: str = "export") -> None:
+        """Export standings (TXT and CSV), the current round's pairings and the tournament state into `dirpath`.
+        Unlike save_tournament_state, the roster is saved in its current order."""
+        self.display_manager.export_standings(
+            self.current_round, self.num_rounds,
+            os.path.join(dirpath, "standings.txt"),
+            os.path.join(dirpath, "standings.csv")
+        )
+        if self.match_manager.get_matches_for_round(self.current_round):
+            self.export_pairings_to_txt(os.path.join(dirpath, f"pairings_round{self.current_round}.txt"))
+        self.file_manager.save_players_to_csv(os.path.join(dirpath, "tournament_players.csv"))
+        self.file_manager.save_matches_to_csv(os.path.join(dirpath, "tournament_matches.csv"))
+        self.file_manager.save_tournament_meta(
+            self.current_round, self.num_rounds,
+            self.player_manager.next_player_id,
+            self.match_manager.next_match_id_in_round,
+            os.path.join(dirpath, "tournament_meta.csv")
+        )
+
     # Utility properties for backward compatibility
     
     @property
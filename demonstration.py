@@ -85,7 +85,7 @@ if __name__ == "__main__":
 
     # --- Simulate Rounds 5-6: Dutch System ---
     for round_num in range(5, 7): # Rounds 5, 6
-        print(f"\n{TournamentUtils.long_line()}")
+        print(f"\n{TournamentUtils.LONG_LINE}")
         print(f"{TournamentUtils.now()} | SIMULATING ROUND {round_num}: DUTCH SYSTEM PAIRING")
 
         # Example: Mark Karen as absent in Round 5
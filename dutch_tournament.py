@@ -1,8 +1,10 @@
 from typing import List, Dict, Tuple, Optional, Set
-import random
+import random, operator
 from collections import defaultdict
 from chess_tournament import *
 
+_POINTS = operator.attrgetter("points")
+
 
 class ScoreGroup:
     """Represents a group of players with the same score."""
@@ -50,15 +52,17 @@ class ScoreGroup:
 class DutchPairingEngine:
     """Specialized pairing engine for Dutch tournament system with proper score groups."""
     
-    def __init__(self, player_manager: PlayerManager):
+    def __init__(self, player_manager: PlayerManager, verbose: bool = False):
         self.player_manager = player_manager
         self.matrix_engine = PairingEngine(player_manager)
+        # Log every pair (or failure) made inside a score group
+        self.verbose = verbose
         self.score_groups: List[ScoreGroup] = []
         
     
     def create_score_groups(self, players: List[List[Player]]) -> None:
         """Create score groups from a list of players and assign it to the object."""
-        players.sort(key=lambda p: p.points, reverse=True)
+        players.sort(key=_POINTS, reverse=True)
         score_dict = defaultdict(list)
         for player in players:
             score_dict[player.points].append(player)
@@ -75,7 +79,7 @@ class DutchPairingEngine:
         Prioritizes non-rematches, then color balance, then ELO.
         """
         # 1. Prioritize non-rematch opponents
-        non_rematch_candidates = [p for p in candidates if p.id not in player.past_opponents]
+        non_rematch_candidates = [p for p in candidates if p.id not in player.past_opponents_set]
 
 
         
@@ -123,8 +127,9 @@ class DutchPairingEngine:
                 pairs.append((player1, opponent))
                 score_group.remove_player(player1)
                 score_group.remove_player(opponent)
-                print(f"{TournamentUtils.now()} | Paired within score group {score_group.score}: {player1.name_surname} vs {opponent.name_surname}")
-            else:
+                if self.verbose:
+                    print(f"{TournamentUtils.now()} | Paired within score group {score_group.score}: {player1.name_surname} vs {opponent.name_surname}")
+            elif self.verbose:
                 print(f"{TournamentUtils.now()} | Could not pair {player1.name_surname} within score group {score_group.score}. Will attempt cross-group pairing.")
         
         return pairs
@@ -154,23 +159,23 @@ class DutchPairingEngine:
 class DutchMatchManager(MatchManager):
     """Match manager specifically for Dutch tournament system."""
     
-    def __init__(self, player_manager: PlayerManager):
+    def __init__(self, player_manager: PlayerManager, verbose: bool = False):
         # Pass a dummy PairingEngine to the base MatchManager __init__
         # The DutchPairingEngine is used directly by DutchMatchManager methods for pairing logic
-        super().__init__(player_manager, PairingEngine(player_manager))
+        super().__init__(player_manager, PairingEngine(player_manager), verbose)
         self.old_pairing_engine = PairingEngine(player_manager)
-        self.pairing_engine = DutchPairingEngine(player_manager) # Override with Dutch specific engine
+        self.pairing_engine = DutchPairingEngine(player_manager, verbose) # Override with Dutch specific engine
 
 
 class DutchTournament(Tournament):
     """Dutch tournament system with proper score group pairing."""
     
-    def __init__(self, num_rounds: int = 5):
-        super().__init__(num_rounds)
+    def __init__(self, num_rounds: int = 5, verbose: bool = False):
+        super().__init__(num_rounds, verbose)
         
         # Replace the match manager with Dutch-specific one
-        self.match_manager = DutchMatchManager(self.player_manager)
-        self.result_tracker = ResultTracker(self.match_manager, self.player_manager)
+        self.match_manager = DutchMatchManager(self.player_manager, verbose)
+        self.result_tracker = ResultTracker(self.match_manager, self.player_manager, verbose)
         # Re-initialize file_manager and display_manager with the new match_manager
         self.file_manager = FileManager(self.player_manager, self.match_manager)
         self.display_manager = DisplayManager(self.player_manager, self.match_manager)
@@ -181,7 +186,7 @@ class DutchTournament(Tournament):
     def pair_round_dutch(self, round_number: int, players_for_pairing: List[Player] ) -> List[Match]:
         """Pair a round using proper Dutch system with score groups."""
         
-        #print(f"\n{TournamentUtils.long_line()}")
+        #print(f"\n{TournamentUtils.LONG_LINE}")
         #print(f"{TournamentUtils.now()} | Pairing Round {round_number} using DUTCH SYSTEM with Score Groups")
 
         
@@ -225,14 +230,18 @@ class DutchTournament(Tournament):
             if len(unpaired_after_dutch_logic) > 20:
                 n = len(unpaired_after_dutch_logic) // 10
                 for i in range(n):
+                    if len(unpaired_after_dutch_logic) < 2:
+                        break
                     l = 11 if len(unpaired_after_dutch_logic) < 11 else len(unpaired_after_dutch_logic) 
-                    generated_matches: list[Match] = self.pair_round_matrix(round_number, players_for_pairing[:l], self.match_manager.old_pairing_engine)
+                    generated_matches: list[Match] = self.pair_round_matrix(round_number, unpaired_after_dutch_logic[:l], self.match_manager.old_pairing_engine)
                     if generated_matches is not None:
                         for match in generated_matches:
-                            unpaired_after_dutch_logic.remove(match.player_black)
-                            unpaired_after_dutch_logic.remove(match.player_white)
-                            paired_player_ids.add(match.player_black.id)
-                            paired_player_ids.add(match.player_white.id)
+                            for player in (match.player_white, match.player_black):
+                                if player.id in paired_player_ids:
+                                    raise ValueError(f"Player {player.name_surname} (ID {player.id}) is already paired in Round {round_number}.")
+                                paired_player_ids.add(player.id)
+                        # One filtering pass instead of a list.remove() per paired player
+                        unpaired_after_dutch_logic = [p for p in unpaired_after_dutch_logic if p.id not in paired_player_ids]
             else:
                 generated_matches: list[Match] = self.pair_round_matrix(round_number, unpaired_after_dutch_logic, self.match_manager.old_pairing_engine)
                 for match in generated_matches:
@@ -258,7 +267,7 @@ class DutchTournament(Tournament):
         self.match_manager.reset_match_id_counter()
 
         # Reset has_bye_this_round for all players at the start of a new round
-        for p in self.player_manager.get_all_players():
+        for p in self.player_manager.players:
             p.has_bye_this_round = False
 
         all_players = self.player_manager.get_all_players()
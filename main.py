@@ -44,9 +44,9 @@ def get_string_input(prompt, valid_options: list = None) -> str:
 
 def display_main_menu():
     clear_screen()
-    print(TournamentUtils.long_line())
+    print(TournamentUtils.LONG_LINE)
     print(f"{TournamentUtils.now()} | Chess Tournament Manager Menu")
-    print(TournamentUtils.long_line())
+    print(TournamentUtils.LONG_LINE)
     print("1. Start New Tournament")
     print("2. Load Existing Tournament")
     print("3. Manage Players")
@@ -56,31 +56,32 @@ def display_main_menu():
     print("7. View Pairings (Current/Past Rounds)")
     print("8. Export Data")
     print("9. Exit")
-    print(TournamentUtils.long_line())
+    print(TournamentUtils.LONG_LINE)
 
 def display_player_management_menu():
     clear_screen()
-    print(TournamentUtils.long_line())
+    print(TournamentUtils.LONG_LINE)
     print(f"{TournamentUtils.now()} | Player Management Menu")
-    print(TournamentUtils.long_line())
+    print(TournamentUtils.LONG_LINE)
     print("1. Add New Player")
     print("2. Toggle Player Presence (for next round)")
     print("3. Remove Player (if no matches played)")
     print("4. View All Players")
     print("5. Back to Main Menu")
-    print(TournamentUtils.long_line())
+    print(TournamentUtils.LONG_LINE)
 
 def display_export_menu():
     clear_screen()
-    print(TournamentUtils.long_line())
+    print(TournamentUtils.LONG_LINE)
     print(f"{TournamentUtils.now()} | Export Data Menu")
-    print(TournamentUtils.long_line())
+    print(TournamentUtils.LONG_LINE)
     print("1. Export Current Standings (CSV)")
     print("2. Export Current Standings (TXT)")
     print("3. Export Pairings for a Round (TXT)")
     print("4. Save Full Tournament State")
-    print("5. Back to Main Menu")
-    print(TournamentUtils.long_line())
+    print("5. Export Everything (standings, current pairings and state)")
+    print("6. Back to Main Menu")
+    print(TournamentUtils.LONG_LINE)
 
 def toggle_player_presence(tournament: Tournament):
     """
@@ -151,7 +152,7 @@ def handle_manual_pairing(tournament: Tournament) -> Tuple[List[tuple[int, int]]
                     print("Error: A player cannot play against themselves. Try again.")
                     continue
 
-                if player2.id in player1.past_opponents:
+                if player2.id in player1.past_opponents_set:
                     print("Warning: These players have already played each other. Do you still want to pair them?")
                     confirm = get_string_input("(y/n): ", ['y', 'n'])
                     if confirm != 'y':
@@ -222,7 +223,7 @@ def main() -> None:
                 if player_choice == 1: # Add New Player
                     name = input("Enter player name: ")
                     elo = get_int_input("Enter player ELO: ", min_val=0)
-                    tournament.add_player(name, elo)
+                    tournament.add_player(name, elo, verbose=True)
                     pause_and_continue()
                 elif player_choice == 2: # Toggle Player Presence (Now a dedicated function)
                     toggle_player_presence(tournament)
@@ -236,8 +237,7 @@ def main() -> None:
                         else:
                             confirm = input(f"Are you sure you want to remove {player_to_remove.name_surname}? (y/n): ").lower()
                             if confirm == 'y':
-                                tournament.player_manager.players = [p for p in tournament.player_manager.get_all_players() if p.id != player_id]
-                                tournament.player_manager.update_next_player_id()
+                                tournament.player_manager.remove_player(player_id)
                                 print(f"{TournamentUtils.now()} | Player {player_to_remove.name_surname} removed.")
                             else:
                                 print(f"{TournamentUtils.now()} | Player removal cancelled.")
@@ -316,7 +316,7 @@ def main() -> None:
                 match_id: int = get_int_input("Choose ID for non-bye match you want to enter the result: ", min_val=1, max_val=matches_for_results[-1].match_id)
                 print("Result Options: 0 (Draw), 1 (White wins), 2 (Black wins)")
                 result_input = get_int_input("Enter result: ", 0, 2)
-                tournament.enter_result(match_id, results_options_map[result_input], tournament.current_round)
+                tournament.enter_result(match_id, results_options_map[result_input], tournament.current_round, verbose=True)
                 enter_more = get_string_input("Would you like to continue? [y/n]: ", ["y", "n"])
             
             confirm_end_round = input("Results entered for this round. End round now? (y/n): ").lower()
@@ -361,7 +361,7 @@ def main() -> None:
             
             while True:
                 display_export_menu()
-                export_choice = get_int_input("Enter your choice: ", 1, 5)
+                export_choice = get_int_input("Enter your choice: ", 1, 6)
 
                 if export_choice == 1: # Export Standings CSV
                     filepath = input(f"Enter filepath for standings CSV (default: {STANDINGS_CSV}): ") or STANDINGS_CSV
@@ -383,7 +383,14 @@ def main() -> None:
                     else:
                         print(f"{TournamentUtils.now()} | Save cancelled.")
                     pause_and_continue()
-                elif export_choice == 5: # Back
+                elif export_choice == 5: # Export Everything
+                    confirm_save = input("This will overwrite the standings and the save files in 'export/'. Continue? (y/n): ").lower()
+                    if confirm_save == 'y':
+                        tournament.export_all("export")
+                    else:
+                        print(f"{TournamentUtils.now()} | Export cancelled.")
+                    pause_and_continue()
+                elif export_choice == 6: # Back
                     break
     
         elif choice == 9: # Exit